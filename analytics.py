@@ -1,55 +1,94 @@
 from __future__ import annotations
 
-from statistics import mean, pstdev
-from typing import Iterable, List
+from typing import Dict, Iterable
 
+import numpy as np
 
-def _to_return_series(prices: Iterable[float]) -> List[float]:
-    items = list(prices)
-    if len(items) < 2:
-        return []
-    return [(items[i] / items[i - 1]) - 1 for i in range(1, len(items)) if items[i - 1] != 0]
+from compat import optional_module
+
+
+def as_price_array(prices: Iterable[float]) -> np.ndarray:
+    """Return ``prices`` as a float64 array without copying arrays that already qualify."""
+    if not isinstance(prices, np.ndarray):
+        prices = list(prices)
+    return np.asarray(prices, dtype=np.float64)
+
+
+def _to_return_series(prices: Iterable[float]) -> np.ndarray:
+    items = as_price_array(prices)
+    if items.size < 2:
+        return np.empty(0, dtype=np.float64)
+    previous = items[:-1]
+    valid = previous != 0
+    ratios = np.divide(items[1:], previous, out=np.ones_like(previous), where=valid)
+    return ratios[valid] - 1
 
 
 def calculate_volatility(prices: Iterable[float]) -> float:
-    returns = _to_return_series(prices)
-    if len(returns) < 2:
+    kernels = optional_module("analytics_numba")
+    if kernels is not None:
+        return float(kernels.vol_from_prices(as_price_array(prices)))
+    return _volatility_from_returns(_to_return_series(prices))
+
+
+def _volatility_from_returns(returns: np.ndarray) -> float:
+    if returns.size < 2:
         return 0.0
-    return pstdev(returns)
+    return float(returns.std())
 
 
 def calculate_beta(asset_prices: Iterable[float], benchmark_prices: Iterable[float]) -> float:
-    asset_returns = _to_return_series(asset_prices)
-    benchmark_returns = _to_return_series(benchmark_prices)
-    length = min(len(asset_returns), len(benchmark_returns))
+    asset_prices = as_price_array(asset_prices)
+    benchmark_prices = as_price_array(benchmark_prices)
+    kernels = optional_module("analytics_numba")
+    if kernels is not None:
+        length = min(asset_prices.size, benchmark_prices.size)
+        beta, ok = kernels.beta_from_prices(
+            asset_prices[asset_prices.size - length :], benchmark_prices[benchmark_prices.size - length :]
+        )
+        if ok:
+            return float(beta)
+    return _beta_from_returns(_to_return_series(asset_prices), _to_return_series(benchmark_prices))
+
+
+def _beta_from_returns(asset_returns: np.ndarray, benchmark_returns: np.ndarray) -> float:
+    length = min(asset_returns.size, benchmark_returns.size)
     if length == 0:
         return 0.0
 
     asset_returns = asset_returns[-length:]
     benchmark_returns = benchmark_returns[-length:]
-    benchmark_mean = mean(benchmark_returns)
-    asset_mean = mean(asset_returns)
-
-    covariance = sum(
-        (a - asset_mean) * (b - benchmark_mean) for a, b in zip(asset_returns, benchmark_returns)
-    ) / length
-    variance = sum((b - benchmark_mean) ** 2 for b in benchmark_returns) / length
+    variance = np.var(benchmark_returns)
     if variance == 0:
         return 0.0
-    return covariance / variance
+    covariance = np.cov(asset_returns, benchmark_returns, bias=True)[0, 1]
+    return float(covariance / variance)
 
 
 def calculate_max_drawdown(prices: Iterable[float]) -> float:
-    series = list(prices)
-    if not series:
+    series = as_price_array(prices)
+    if series.size == 0:
         return 0.0
 
-    peak = series[0]
-    max_drawdown = 0.0
-    for price in series:
-        peak = max(peak, price)
-        if peak == 0:
-            continue
-        drawdown = (price - peak) / peak
-        max_drawdown = min(max_drawdown, drawdown)
-    return abs(max_drawdown)
+    peaks = np.maximum.accumulate(series)
+    drawdowns = np.divide(series - peaks, peaks, out=np.zeros_like(series), where=peaks != 0)
+    return float(abs(min(drawdowns.min(), 0.0)))
+
+
+def calculate_price_metrics(asset_prices: Iterable[float], benchmark_prices: Iterable[float]) -> Dict[str, float]:
+    """Volatility, beta and max drawdown of ``asset_prices`` sharing a single traversal."""
+    asset_prices = as_price_array(asset_prices)
+    benchmark_prices = as_price_array(benchmark_prices)
+    kernels = optional_module("analytics_numba")
+    if kernels is not None:
+        volatility, beta, beta_ok, max_drawdown = kernels.metrics_from_prices(asset_prices, benchmark_prices)
+        if not beta_ok:
+            beta = calculate_beta(asset_prices, benchmark_prices)
+        return {"volatility": float(volatility), "beta": float(beta), "max_drawdown": float(max_drawdown)}
+
+    asset_returns = _to_return_series(asset_prices)
+    return {
+        "volatility": _volatility_from_returns(asset_returns),
+        "beta": _beta_from_returns(asset_returns, _to_return_series(benchmark_prices)),
+        "max_drawdown": calculate_max_drawdown(asset_prices),
+    }
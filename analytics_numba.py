@@ -0,0 +1,122 @@
+"""Numba-compiled single-pass kernels backing :mod:`analytics`.
+
+Importing this module raises ``ImportError`` when numba is not installed;
+``analytics`` then falls back to its NumPy implementation.
+"""
+from __future__ import annotations
+
+import math
+
+from numba import njit
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def vol_from_prices(prices):
+    """Population standard deviation of simple returns using Welford updates."""
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(1, prices.shape[0]):
+        previous = prices[i - 1]
+        if previous == 0:
+            continue
+        x = prices[i] / previous - 1
+        count += 1
+        delta = x - mean
+        mean += delta / count
+        m2 += (x - mean) * delta
+    if count < 2:
+        return 0.0
+    return math.sqrt(m2 / count)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def beta_from_prices(asset_prices, benchmark_prices):
+    """Beta of aligned price series; returns ``(beta, ok)``.
+
+    ``ok`` is ``False`` when a zero price would drop a return from one series
+    but not the other, in which case the caller must realign the returns itself.
+    """
+    count = 0
+    mean_a = 0.0
+    mean_b = 0.0
+    co_moment = 0.0
+    m2_b = 0.0
+    for i in range(1, asset_prices.shape[0]):
+        previous_a = asset_prices[i - 1]
+        previous_b = benchmark_prices[i - 1]
+        if previous_a == 0 or previous_b == 0:
+            return 0.0, False
+        a = asset_prices[i] / previous_a - 1
+        b = benchmark_prices[i] / previous_b - 1
+        count += 1
+        delta_b = b - mean_b
+        mean_a += (a - mean_a) / count
+        mean_b += delta_b / count
+        co_moment += (a - mean_a) * delta_b
+        m2_b += (b - mean_b) * delta_b
+    if count == 0 or m2_b == 0:
+        return 0.0, True
+    return co_moment / m2_b, True
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def metrics_from_prices(asset_prices, benchmark_prices):
+    """Volatility, beta and max drawdown in a single loop over ``asset_prices``.
+
+    Returns ``(volatility, beta, beta_ok, max_drawdown)`` with ``beta_ok`` as in
+    :func:`beta_from_prices`; the benchmark is aligned on the trailing ticks.
+    """
+    size = asset_prices.shape[0]
+    length = min(size, benchmark_prices.shape[0])
+    asset_offset = size - length
+    benchmark_offset = benchmark_prices.shape[0] - length
+
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    beta_ok = True
+    beta_count = 0
+    mean_a = 0.0
+    mean_b = 0.0
+    co_moment = 0.0
+    m2_b = 0.0
+    peak = asset_prices[0] if size > 0 else 0.0
+    max_drawdown = 0.0
+    for i in range(size):
+        price = asset_prices[i]
+        if price > peak:
+            peak = price
+        if peak != 0:
+            drawdown = (price - peak) / peak
+            if drawdown < max_drawdown:
+                max_drawdown = drawdown
+        if i == 0:
+            continue
+
+        previous = asset_prices[i - 1]
+        if previous != 0:
+            x = price / previous - 1
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += (x - mean) * delta
+
+        if beta_ok and i > asset_offset:
+            j = i - asset_offset + benchmark_offset
+            previous_b = benchmark_prices[j - 1]
+            if previous == 0 or previous_b == 0:
+                beta_ok = False
+                continue
+            a = price / previous - 1
+            b = benchmark_prices[j] / previous_b - 1
+            beta_count += 1
+            delta_b = b - mean_b
+            mean_a += (a - mean_a) / beta_count
+            mean_b += delta_b / beta_count
+            co_moment += (a - mean_a) * delta_b
+            m2_b += (b - mean_b) * delta_b
+
+    volatility = math.sqrt(m2 / count) if count >= 2 else 0.0
+    beta = co_moment / m2_b if beta_count > 0 and m2_b != 0 else 0.0
+    return volatility, beta, beta_ok, abs(max_drawdown)
@@ -0,0 +1,25 @@
+"""Optional-dependency shims with no imports from the rest of the package."""
+from __future__ import annotations
+
+from functools import lru_cache
+from importlib import import_module
+from types import ModuleType
+from typing import Optional
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser.
+    from json import loads as json_loads
+
+
+@lru_cache(maxsize=None)
+def optional_module(name: str) -> Optional[ModuleType]:
+    """Import ``name`` on first use, or return ``None`` when it or one of its dependencies is missing.
+
+    The Numba kernel modules are loaded through this so numba's import cost is only paid
+    once a kernel is actually needed.
+    """
+    try:
+        return import_module(name)
+    except ImportError:
+        return None
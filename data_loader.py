@@ -1,35 +1,61 @@
 from __future__ import annotations
 
 import csv
-import json
-from dataclasses import dataclass
+import mmap
+import os
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Iterator, List, Optional, Sequence
-from xml.etree import ElementTree as ET
+from sys import intern
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
+try:
+    from lxml import etree as ET
+except ImportError:  # lxml is optional; the stdlib parser exposes the same API used here.
+    from xml.etree import ElementTree as ET
+
+from compat import json_loads
 from models import Instrument
 from patterns.factory import InstrumentFactory
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@lru_cache(maxsize=4096)
+def _parse_ts(value: str | bytes) -> datetime:
+    """Parse a fixed-width ``YYYY-MM-DD HH:MM:SS`` timestamp (text or bytes) without ``strptime``."""
+    return datetime(
+        int(value[0:4]), int(value[5:7]), int(value[8:10]), int(value[11:13]), int(value[14:16]), int(value[17:19])
+    )
 
-@dataclass(frozen=True)
-class MarketDataPoint:
+
+class MarketDataPoint(NamedTuple):
     timestamp: datetime
     symbol: str
     price: float
 
 
+@lru_cache(maxsize=16)
+def _read_instrument_rows(path: Path, mtime_ns: int) -> Tuple[Dict[str, str], ...]:
+    """Parsed instrument rows; ``mtime_ns`` is part of the key so edits to the file invalidate it."""
+    rows = []
+    with path.open("r", newline="", encoding="utf-8") as handle:
+        for row in csv.DictReader(handle):
+            if row.get("symbol"):
+                row["symbol"] = intern(row["symbol"])
+            rows.append(row)
+    return tuple(rows)
+
+
 class InstrumentCSVLoader:
     def __init__(self, path: str | Path) -> None:
         self.path = Path(path)
 
     def load(self) -> List[Instrument]:
-        instruments: List[Instrument] = []
-        with self.path.open("r", newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            for row in reader:
-                instruments.append(InstrumentFactory.create_instrument(row))
-        return instruments
+        # Only the parse is cached: instruments are mutable, so every call builds fresh ones.
+        rows = _read_instrument_rows(self.path.resolve(), self.path.stat().st_mtime_ns)
+        return [InstrumentFactory.create_instrument(row) for row in rows]
 
 
 class MarketDataLoader:
@@ -37,31 +63,140 @@ class MarketDataLoader:
         self.path = Path(path)
 
     def iter_ticks(
-        self, symbols: Optional[Sequence[str]] = None, limit: Optional[int] = None
+        self,
+        symbols: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        limit_per_symbol: Optional[int] = None,
     ) -> Iterator[MarketDataPoint]:
-        symbols_filter = set(symbols) if symbols else None
+        symbols_filter = frozenset(symbols) if symbols else None
+        # With a per-symbol quota the scan can stop once every requested symbol is full, but a
+        # symbol the file never mentions can never fill, so only those that occur are awaited.
+        fill_target = None
+        if symbols_filter is not None and limit_per_symbol is not None:
+            fill_target = len(self._symbols_in_file(symbols_filter))
+            if fill_target == 0:
+                return
+        per_symbol_counts: Dict[str, int] = {}
+        filled_symbols = 0
         count = 0
         with self.path.open("r", newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if header is None:
+                return
+            ts_index = header.index("timestamp")
+            symbol_index = header.index("symbol")
+            price_index = header.index("price")
             for row in reader:
-                symbol = row["symbol"]
-                if symbols_filter and symbol not in symbols_filter:
+                if not row:
                     continue
-                timestamp = datetime.strptime(row["timestamp"], "%Y-%m-%d %H:%M:%S")
-                price = float(row["price"])
-                yield MarketDataPoint(timestamp=timestamp, symbol=symbol, price=price)
+                symbol = row[symbol_index]
+                if symbols_filter is not None and symbol not in symbols_filter:
+                    continue
+                if limit_per_symbol is not None:
+                    symbol_count = per_symbol_counts.get(symbol, 0)
+                    if symbol_count >= limit_per_symbol:
+                        continue
+                    per_symbol_counts[symbol] = symbol_count + 1
+                    if symbol_count + 1 == limit_per_symbol:
+                        filled_symbols += 1
+                timestamp = _parse_ts(row[ts_index])
+                price = float(row[price_index])
+                yield MarketDataPoint(timestamp, intern(symbol), price)
                 count += 1
                 if limit is not None and count >= limit:
                     break
+                if filled_symbols == fill_target:
+                    break
+
+    def _symbols_in_file(self, symbols: Iterable[str]) -> FrozenSet[str]:
+        """Those of ``symbols`` whose text occurs anywhere in the file, a superset of those with ticks."""
+        with self.path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return frozenset()
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return frozenset(symbol for symbol in symbols if buffer.find(symbol.encode("utf-8")) != -1)
+
+    def iter_ticks_mmap(
+        self, symbols: Optional[Sequence[str]] = None, limit: Optional[int] = None
+    ) -> Iterator[MarketDataPoint]:
+        """Equivalent of :meth:`iter_ticks` that scans a memory-mapped file as raw bytes.
+
+        Rows are split on commas without CSV quoting rules, which holds for the tick files
+        produced here. Symbols are filtered as bytes before anything is decoded or parsed.
+        """
+        symbols_filter = frozenset(symbol.encode("utf-8") for symbol in symbols) if symbols else None
+        decoded_symbols: Dict[bytes, str] = {}
+        count = 0
+        with self.path.open("rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                header = buffer.readline().rstrip(b"\r\n").split(b",")
+                ts_index = header.index(b"timestamp")
+                symbol_index = header.index(b"symbol")
+                price_index = header.index(b"price")
+                for line in iter(buffer.readline, b""):
+                    line = line.rstrip(b"\r\n")
+                    if not line:
+                        continue
+                    fields = line.split(b",")
+                    raw_symbol = fields[symbol_index]
+                    if symbols_filter is not None and raw_symbol not in symbols_filter:
+                        continue
+                    symbol = decoded_symbols.get(raw_symbol)
+                    if symbol is None:
+                        symbol = decoded_symbols[raw_symbol] = intern(raw_symbol.decode("utf-8"))
+                    yield MarketDataPoint(_parse_ts(fields[ts_index]), symbol, float(fields[price_index]))
+                    count += 1
+                    if limit is not None and count >= limit:
+                        break
+
+    def load_frame(self) -> "pd.DataFrame":
+        """Parse the whole tick file in one columnar pass (requires pandas)."""
+        # Imported here so only callers of the bulk loader pay pandas' import cost.
+        try:
+            import pandas as pd
+        except ImportError as exc:
+            raise ImportError("pandas is required for MarketDataLoader.load_frame") from exc
+        frame = pd.read_csv(
+            self.path,
+            parse_dates=["timestamp"],
+            date_format="%Y-%m-%d %H:%M:%S",
+            dtype={"symbol": "category", "price": "float64"},
+        )
+        frame["timestamp"] = frame["timestamp"].astype("datetime64[us]")
+        return frame
+
+    def iter_ticks_fast(
+        self, symbols: Optional[Sequence[str]] = None, limit: Optional[int] = None
+    ) -> Iterator[MarketDataPoint]:
+        """Columnar equivalent of :meth:`iter_ticks` backed by :meth:`load_frame`."""
+        frame = self.load_frame()
+        if symbols:
+            frame = frame[frame["symbol"].isin(symbols)]
+        if limit is not None:
+            frame = frame.head(limit)
+        timestamps = frame["timestamp"].to_numpy().astype(object)
+        # Map category codes back through interned names instead of materialising a string per row.
+        categories = [intern(str(name)) for name in frame["symbol"].cat.categories]
+        tickers = [categories[code] for code in frame["symbol"].cat.codes.tolist()]
+        prices = frame["price"].to_numpy().tolist()
+        for timestamp, symbol, price in zip(timestamps, tickers, prices):
+            yield MarketDataPoint(timestamp, symbol, price)
 
 
 class YahooFinanceAdapter:
     def __init__(self, path: str | Path) -> None:
         self.path = Path(path)
 
+    @cached_property
+    def _payload(self) -> Dict:
+        with self.path.open("rb") as handle:
+            return json_loads(handle.read())
+
     def get_data(self, symbol: str) -> MarketDataPoint:
-        with self.path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = self._payload
         if payload.get("ticker") != symbol:
             raise ValueError(f"Symbol {symbol} not found in Yahoo payload")
         timestamp = datetime.fromisoformat(payload["timestamp"].replace("Z", "+00:00"))
@@ -72,9 +207,12 @@ class BloombergXMLAdapter:
     def __init__(self, path: str | Path) -> None:
         self.path = Path(path)
 
+    @cached_property
+    def _payload(self) -> ET.Element:
+        return ET.parse(str(self.path)).getroot()
+
     def get_data(self, symbol: str) -> MarketDataPoint:
-        tree = ET.parse(self.path)
-        root = tree.getroot()
+        root = self._payload
         xml_symbol = root.findtext("symbol")
         if xml_symbol != symbol:
             raise ValueError(f"Symbol {symbol} not found in Bloomberg payload")
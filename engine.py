@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
 
 from data_loader import MarketDataPoint
 from patterns.command import CommandInvoker, ExecuteOrderCommand, OrderBook
@@ -34,5 +36,14 @@ class TradingEngine:
         for tick in ticks:
             self.process_tick(tick)
 
+    def run_batch(
+        self, timestamps: np.ndarray, symbol_ids: np.ndarray, prices: np.ndarray, symbols: Sequence[str]
+    ) -> None:
+        """Run the strategy over structure-of-arrays ticks; ``symbols[i]`` names symbol id ``i``."""
+        signals = self.strategy.batch_signals(timestamps, symbol_ids, prices, symbols)
+        self.publisher.notify_batch(signals)
+        for signal in signals:
+            self.invoker.execute(ExecuteOrderCommand(self.order_book, signal))
+
     def switch_strategy(self, strategy: Strategy) -> None:
         self.strategy = strategy
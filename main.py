@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Iterable, List, Type
 
+import numpy as np
+
+from compat import json_loads
 from data_loader import (
     BloombergXMLAdapter,
     InstrumentCSVLoader,
@@ -10,48 +15,57 @@ from data_loader import (
     YahooFinanceAdapter,
 )
 from engine import TradingEngine
-from models import BetaDecorator, DrawdownDecorator, Instrument, Portfolio, VolatilityDecorator
+from models import Instrument, MultiMetricsDecorator, Portfolio
 from patterns.builder import PortfolioBuilder
 from patterns.command import CommandInvoker
 from patterns.observer import SignalPublisher
-from patterns.singleton import Config
+from patterns.singleton import get_config
 from patterns.strategy import BreakoutStrategy, MeanReversionStrategy, Strategy
 from reporting import SignalReporter, portfolio_snapshot
 
 
 def _load_strategy_params(path: str | Path) -> dict:
-    with Path(path).open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    with Path(path).open("rb") as handle:
+        return json_loads(handle.read())
 
 
 def _load_portfolio(path: str | Path) -> Portfolio:
-    with Path(path).open("r", encoding="utf-8") as handle:
-        data = json.load(handle)
+    with Path(path).open("rb") as handle:
+        data = json_loads(handle.read())
     return PortfolioBuilder.from_dict(data)
 
 
-def _decorate_instrument_with_metrics(instrument: Instrument, benchmark_symbol: str, history_window: int = 50) -> Instrument:
-    loader = MarketDataLoader("market_data.csv")
-    price_history = [tick.price for tick in loader.iter_ticks(symbols=[instrument.symbol], limit=history_window)]
-    benchmark_history = [
-        tick.price for tick in MarketDataLoader("market_data.csv").iter_ticks(symbols=[benchmark_symbol], limit=history_window)
-    ]
-    decorated = VolatilityDecorator(instrument, price_history)
-    decorated = BetaDecorator(decorated, price_history, benchmark_history)
-    decorated = DrawdownDecorator(decorated, price_history)
-    return decorated
+def _load_price_histories(path: str | Path, symbols: Iterable[str], history_window: int = 50) -> Dict[str, np.ndarray]:
+    histories: Dict[str, List[float]] = {}
+    for tick in MarketDataLoader(path).iter_ticks(symbols=list(symbols), limit_per_symbol=history_window):
+        histories.setdefault(tick.symbol, []).append(tick.price)
+    return {symbol: np.asarray(prices, dtype=np.float64) for symbol, prices in histories.items()}
+
+
+def _decorate_instrument_with_metrics(
+    instrument: Instrument, histories: Dict[str, np.ndarray], benchmark_symbol: str, history_window: int = 50
+) -> Instrument:
+    empty = np.empty(0, dtype=np.float64)
+    price_history = histories.get(instrument.symbol, empty)[:history_window]
+    benchmark_history = histories.get(benchmark_symbol, empty)[:history_window]
+    return MultiMetricsDecorator(instrument, price_history, benchmark_history)
+
+
+_STRATEGIES: Dict[str, Type[Strategy]] = {
+    "MeanReversionStrategy": MeanReversionStrategy,
+    "BreakoutStrategy": BreakoutStrategy,
+}
 
 
 def _instantiate_strategy(name: str, params: dict) -> Strategy:
-    if name == "MeanReversionStrategy":
-        return MeanReversionStrategy(params["lookback_window"], params["threshold"])
-    if name == "BreakoutStrategy":
-        return BreakoutStrategy(params["lookback_window"], params["threshold"])
-    raise ValueError(f"Unsupported strategy {name}")
+    strategy_cls = _STRATEGIES.get(name)
+    if strategy_cls is None:
+        raise ValueError(f"Unsupported strategy {name}")
+    return strategy_cls(params["lookback_window"], params["threshold"])
 
 
 def main() -> None:
-    config = Config()
+    config = get_config()
     instruments = InstrumentCSVLoader("instruments.csv").load()
     portfolio = _load_portfolio("portfolio_structure.json")
 
@@ -85,10 +99,16 @@ def main() -> None:
     external_points = [yahoo_point, bloomberg_point]
 
     # Decorate instrument analytics.
-    decorated_instruments = {
-        instrument.symbol: _decorate_instrument_with_metrics(instrument, benchmark_symbol="SPY").get_metrics()
-        for instrument in instruments
-    }
+    benchmark_symbol = "SPY"
+    histories = _load_price_histories(
+        "market_data.csv", {instrument.symbol for instrument in instruments} | {benchmark_symbol}
+    )
+    with ThreadPoolExecutor() as executor:
+        metrics = executor.map(
+            lambda instrument: _decorate_instrument_with_metrics(instrument, histories, benchmark_symbol).get_metrics(),
+            instruments,
+        )
+        decorated_instruments = {instrument.symbol: result for instrument, result in zip(instruments, metrics)}
 
     summary = {
         "config": config.data,
@@ -8,6 +8,8 @@ from typing import Dict, Iterable, List, Optional
 class Instrument(ABC):
     """Base domain object representing a financial instrument."""
 
+    __slots__ = ("symbol", "price", "sector")
+
     def __init__(self, symbol: str, price: float, sector: Optional[str] = None) -> None:
         self.symbol = symbol
         self.price = price
@@ -22,12 +24,16 @@ class Instrument(ABC):
 
 
 class Stock(Instrument):
+    __slots__ = ("issuer",)
+
     def __init__(self, symbol: str, price: float, sector: Optional[str], issuer: Optional[str]) -> None:
         super().__init__(symbol, price, sector)
         self.issuer = issuer
 
 
 class Bond(Instrument):
+    __slots__ = ("issuer", "maturity")
+
     def __init__(
         self,
         symbol: str,
@@ -42,6 +48,8 @@ class Bond(Instrument):
 
 
 class ETF(Instrument):
+    __slots__ = ("issuer",)
+
     def __init__(self, symbol: str, price: float, sector: Optional[str], issuer: Optional[str]) -> None:
         super().__init__(symbol, price, sector)
         self.issuer = issuer
@@ -63,8 +71,10 @@ class InstrumentDecorator(Instrument):
 
 class VolatilityDecorator(InstrumentDecorator):
     def __init__(self, instrument: Instrument, price_history: Iterable[float]) -> None:
+        from analytics import as_price_array
+
         super().__init__(instrument)
-        self._price_history = list(price_history)
+        self._price_history = as_price_array(price_history)
 
     def get_metrics(self) -> Dict[str, float]:
         from analytics import calculate_volatility
@@ -78,9 +88,11 @@ class BetaDecorator(InstrumentDecorator):
     def __init__(
         self, instrument: Instrument, asset_prices: Iterable[float], benchmark_prices: Iterable[float]
     ) -> None:
+        from analytics import as_price_array
+
         super().__init__(instrument)
-        self._asset_prices = list(asset_prices)
-        self._benchmark_prices = list(benchmark_prices)
+        self._asset_prices = as_price_array(asset_prices)
+        self._benchmark_prices = as_price_array(benchmark_prices)
 
     def get_metrics(self) -> Dict[str, float]:
         from analytics import calculate_beta
@@ -92,8 +104,10 @@ class BetaDecorator(InstrumentDecorator):
 
 class DrawdownDecorator(InstrumentDecorator):
     def __init__(self, instrument: Instrument, price_history: Iterable[float]) -> None:
+        from analytics import as_price_array
+
         super().__init__(instrument)
-        self._price_history = list(price_history)
+        self._price_history = as_price_array(price_history)
 
     def get_metrics(self) -> Dict[str, float]:
         from analytics import calculate_max_drawdown
@@ -103,9 +117,31 @@ class DrawdownDecorator(InstrumentDecorator):
         return metrics
 
 
+class MultiMetricsDecorator(InstrumentDecorator):
+    """Adds volatility, beta and drawdown together, computed in one pass over the prices."""
+
+    def __init__(
+        self, instrument: Instrument, price_history: Iterable[float], benchmark_prices: Iterable[float]
+    ) -> None:
+        from analytics import as_price_array
+
+        super().__init__(instrument)
+        self._price_history = as_price_array(price_history)
+        self._benchmark_prices = as_price_array(benchmark_prices)
+
+    def get_metrics(self) -> Dict[str, float]:
+        from analytics import calculate_price_metrics
+
+        metrics = super().get_metrics()
+        metrics.update(calculate_price_metrics(self._price_history, self._benchmark_prices))
+        return metrics
+
+
 class PortfolioComponent(ABC):
     """Composite root for positions and nested portfolios."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_value(self) -> float:
         raise NotImplementedError
@@ -116,6 +152,8 @@ class PortfolioComponent(ABC):
 
 
 class Position(PortfolioComponent):
+    __slots__ = ("symbol", "quantity", "price")
+
     def __init__(self, symbol: str, quantity: float, price: float) -> None:
         self.symbol = symbol
         self.quantity = quantity
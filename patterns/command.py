@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from patterns.strategy import Signal
 
 
 class Command(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def execute(self) -> None:
         raise NotImplementedError
@@ -18,48 +24,87 @@ class OrderBook:
     """Minimal in-memory order book for command demonstrations."""
 
     def __init__(self) -> None:
-        self._executed_orders: List[Dict] = []
-
-    def execute(self, order: Dict) -> None:
-        self._executed_orders.append(order)
-
-    def reverse(self, order: Dict) -> None:
-        if order in self._executed_orders:
-            self._executed_orders.remove(order)
+        self._executed_orders: Dict[int, Signal] = {}
+        # id(order) -> ids of the live executions of that exact object, oldest first.
+        self._order_ids: Dict[int, List[int]] = {}
+        self._next_order_id = 0
+
+    def execute(self, order: Signal, order_id: Optional[int] = None) -> int:
+        if order_id is None:
+            order_id = self._next_order_id
+            self._next_order_id += 1
+        self._executed_orders[order_id] = order
+        self._order_ids.setdefault(id(order), []).append(order_id)
+        return order_id
+
+    def reverse(self, order_id: int) -> Optional[Signal]:
+        order = self._executed_orders.pop(order_id, None)
+        if order is not None:
+            live_ids = self._order_ids[id(order)]
+            live_ids.remove(order_id)
+            if not live_ids:
+                del self._order_ids[id(order)]
+        return order
+
+    def find_order_id(self, order: Signal) -> Optional[int]:
+        live_ids = self._order_ids.get(id(order))
+        if live_ids:
+            return live_ids[-1]
+        # Equal but distinct order objects are only reachable through a scan.
+        for order_id, executed in self._executed_orders.items():
+            if executed == order:
+                return order_id
+        return None
+
+    def __contains__(self, order: object) -> bool:
+        """O(1) identity membership: whether this exact order object is currently executed."""
+        return id(order) in self._order_ids
 
     @property
-    def executed_orders(self) -> List[Dict]:
-        return list(self._executed_orders)
+    def executed_orders(self) -> List[Signal]:
+        return list(self._executed_orders.values())
 
 
 class ExecuteOrderCommand(Command):
-    def __init__(self, order_book: OrderBook, order: Dict) -> None:
+    __slots__ = ("order_book", "order", "order_id")
+
+    def __init__(self, order_book: OrderBook, order: Signal) -> None:
         self.order_book = order_book
         self.order = order
+        self.order_id: Optional[int] = None
 
     def execute(self) -> None:
-        self.order_book.execute(self.order)
+        self.order_id = self.order_book.execute(self.order)
 
     def undo(self) -> None:
-        self.order_book.reverse(self.order)
+        if self.order_id is not None:
+            self.order_book.reverse(self.order_id)
+            self.order_id = None
 
 
 class UndoOrderCommand(Command):
-    def __init__(self, order_book: OrderBook, order: Dict) -> None:
+    __slots__ = ("order_book", "order", "order_id")
+
+    def __init__(self, order_book: OrderBook, order: Signal) -> None:
         self.order_book = order_book
         self.order = order
+        self.order_id: Optional[int] = None
 
     def execute(self) -> None:
-        self.order_book.reverse(self.order)
+        self.order_id = self.order_book.find_order_id(self.order)
+        if self.order_id is not None:
+            self.order_book.reverse(self.order_id)
 
     def undo(self) -> None:
-        self.order_book.execute(self.order)
+        # Restore under the original id so the command that placed the order can still reverse it.
+        self.order_book.execute(self.order, self.order_id)
 
 
 class CommandInvoker:
-    def __init__(self) -> None:
-        self._history: List[Command] = []
-        self._redo_stack: List[Command] = []
+    def __init__(self, max_history: Optional[int] = None) -> None:
+        self._max_history = max_history
+        self._history: Deque[Command] = deque(maxlen=self._max_history)
+        self._redo_stack: Deque[Command] = deque(maxlen=self._max_history)
 
     def execute(self, command: Command) -> None:
         command.execute()
@@ -1,32 +1,59 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict
+from functools import lru_cache, partial
+from typing import Callable, Dict, Type
 
 from models import Bond, ETF, Instrument, Stock
 
 
+def _build_listed(instrument_cls: Type[Instrument], data: Dict[str, str]) -> Instrument:
+    return instrument_cls(
+        symbol=data.get("symbol"),
+        price=float(data.get("price", 0.0)),
+        sector=data.get("sector"),
+        issuer=data.get("issuer"),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def _build_bond(data: Dict[str, str]) -> Bond:
+    maturity_raw = data.get("maturity")
+    return Bond(
+        symbol=data.get("symbol"),
+        price=float(data.get("price", 0.0)),
+        sector=data.get("sector"),
+        issuer=data.get("issuer"),
+        maturity=_parse_iso(maturity_raw) if maturity_raw else None,
+    )
+
+
 class InstrumentFactory:
     """Factory responsible for instantiating instruments from raw dictionaries."""
 
-    _type_map = {
-        "stock": Stock,
-        "bond": Bond,
-        "etf": ETF,
+    _builders: Dict[str, Callable[[Dict[str, str]], Instrument]] = {
+        "stock": partial(_build_listed, Stock),
+        "bond": _build_bond,
+        "etf": partial(_build_listed, ETF),
+    }
+    # Common spellings ("Stock", "STOCK", ...) resolve without normalising the raw value.
+    _builders_by_spelling: Dict[str, Callable[[Dict[str, str]], Instrument]] = {
+        spelling: builder
+        for name, builder in _builders.items()
+        for spelling in (name, name.title(), name.upper())
     }
 
     @classmethod
     def create_instrument(cls, data: Dict[str, str]) -> Instrument:
-        instrument_type = (data.get("type") or "").lower()
-        symbol = data.get("symbol")
-        price = float(data.get("price", 0.0))
-        sector = data.get("sector")
-        issuer = data.get("issuer")
-        if instrument_type not in cls._type_map:
-            raise ValueError(f"Unsupported instrument type: {instrument_type}")
-
-        if instrument_type == "bond":
-            maturity_raw = data.get("maturity")
-            maturity = datetime.fromisoformat(maturity_raw) if maturity_raw else None
-            return Bond(symbol=symbol, price=price, sector=sector, issuer=issuer, maturity=maturity)
-        return cls._type_map[instrument_type](symbol=symbol, price=price, sector=sector, issuer=issuer)
+        raw_type = data.get("type") or ""
+        builder = cls._builders_by_spelling.get(raw_type)
+        if builder is None:
+            instrument_type = raw_type.casefold()
+            builder = cls._builders.get(instrument_type)
+            if builder is None:
+                raise ValueError(f"Unsupported instrument type: {instrument_type}")
+        return builder(data)
@@ -2,52 +2,88 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Sequence, Set, Tuple
+
+if TYPE_CHECKING:
+    from patterns.strategy import Signal
 
 
 class Observer(ABC):
     @abstractmethod
-    def update(self, signal: Dict) -> None:
+    def update(self, signal: Signal) -> None:
         raise NotImplementedError
 
+    def update_batch(self, signals: Sequence[Signal]) -> None:
+        """Handle several signals in one call; override when a batch can be processed faster."""
+        for signal in signals:
+            self.update(signal)
+
 
 class SignalPublisher:
     def __init__(self) -> None:
-        self._observers: List[Observer] = []
+        # Copy-on-write: attach/detach swap in a new tuple, so notify can iterate without copying or locking.
+        self._observers: Tuple[Observer, ...] = ()
+        self._observer_set: Set[Observer] = set()
 
     def attach(self, observer: Observer) -> None:
-        if observer not in self._observers:
-            self._observers.append(observer)
+        if observer not in self._observer_set:
+            self._observer_set.add(observer)
+            self._observers = (*self._observers, observer)
 
     def detach(self, observer: Observer) -> None:
-        if observer in self._observers:
-            self._observers.remove(observer)
+        if observer in self._observer_set:
+            self._observer_set.discard(observer)
+            self._observers = tuple(existing for existing in self._observers if existing != observer)
 
-    def notify(self, signal: Dict) -> None:
-        for observer in list(self._observers):
+    def notify(self, signal: Signal) -> None:
+        for observer in self._observers:
             observer.update(signal)
 
+    def notify_batch(self, signals: Sequence[Signal]) -> None:
+        if not signals:
+            return
+        for observer in self._observers:
+            observer.update_batch(signals)
+
 
 class LoggerObserver(Observer):
     def __init__(self, logger: logging.Logger | None = None) -> None:
         self.logger = logger or logging.getLogger("signal_logger")
-        self.records: List[Dict] = []
+        self.records: List[Signal] = []
 
-    def update(self, signal: Dict) -> None:
+    def update(self, signal: Signal) -> None:
         self.records.append(signal)
         self.logger.info("Signal generated: %s", signal)
 
+    def update_batch(self, signals: Sequence[Signal]) -> None:
+        self.records.extend(signals)
+        if self.logger.isEnabledFor(logging.INFO):
+            for signal in signals:
+                self.logger.info("Signal generated: %s", signal)
+
 
 class AlertObserver(Observer):
     def __init__(self, threshold_notional: float) -> None:
         self.threshold_notional = threshold_notional
         self.alerts: List[Dict] = []
+        # Signals are immutable and hashable, so alerted ones can be looked up by hash.
+        self._alerted: Set[Signal] = set()
+
+    def update(self, signal: Signal) -> None:
+        notional = abs(signal.size) * signal.price
+        if notional < self.threshold_notional:
+            return
+        alert = signal._asdict()
+        alert["notional"] = notional
+        self.alerts.append(alert)
+        self._alerted.add(signal)
+
+    def update_batch(self, signals: Sequence[Signal]) -> None:
+        threshold = self.threshold_notional
+        notionals = [abs(signal.size) * signal.price for signal in signals]
+        alerted = [(signal, notional) for signal, notional in zip(signals, notionals) if notional >= threshold]
+        self.alerts.extend({**signal._asdict(), "notional": notional} for signal, notional in alerted)
+        self._alerted.update(signal for signal, _ in alerted)
 
-    def update(self, signal: Dict) -> None:
-        size = abs(signal.get("size", 1))
-        price = signal.get("price", 0.0)
-        notional = size * price
-        if notional >= self.threshold_notional:
-            alert = dict(signal)
-            alert["notional"] = notional
-            self.alerts.append(alert)
+    def __contains__(self, signal: object) -> bool:
+        return signal in self._alerted
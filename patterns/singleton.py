@@ -1,20 +1,30 @@
 from __future__ import annotations
 
-import json
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
+from compat import json_loads
+
+
+_singleton_lock = threading.RLock()
+
 
 class SingletonMeta(type):
     """Metaclass ensuring only one instance exists."""
 
-    _instances: Dict[type, Any] = {}
-
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            instance = super().__call__(*args, **kwargs)
-            cls._instances[cls] = instance
-        return cls._instances[cls]
+        # Read the class's own namespace so subclasses do not inherit their parent's instance.
+        instance = cls.__dict__.get("_singleton_instance")
+        if instance is not None:
+            return instance
+        with _singleton_lock:
+            instance = cls.__dict__.get("_singleton_instance")
+            if instance is None:
+                instance = super().__call__(*args, **kwargs)
+                cls._singleton_instance = instance
+        return instance
 
 
 class Config(metaclass=SingletonMeta):
@@ -31,8 +41,8 @@ class Config(metaclass=SingletonMeta):
     def _load(self) -> None:
         if not self._path.exists():
             raise FileNotFoundError(f"Config file not found: {self._path}")
-        with self._path.open("r", encoding="utf-8") as fh:
-            self._data = json.load(fh)
+        with self._path.open("rb") as fh:
+            self._data = json_loads(fh.read())
 
     def get(self, key: str, default: Any = None) -> Any:
         return self._data.get(key, default)
@@ -40,3 +50,9 @@ class Config(metaclass=SingletonMeta):
     @property
     def data(self) -> Dict[str, Any]:
         return dict(self._data)
+
+
+@lru_cache(maxsize=None)
+def get_config() -> Config:
+    """Return the shared :class:`Config`, built on first use rather than at import time."""
+    return Config()
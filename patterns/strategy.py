@@ -1,11 +1,56 @@
 from __future__ import annotations
 
+import math
 from abc import ABC, abstractmethod
 from collections import deque
-from typing import Deque, Dict, List
+from datetime import datetime
+from sys import intern
+from typing import Deque, Dict, Iterable, List, NamedTuple, Sequence, Tuple
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from compat import optional_module
 from data_loader import MarketDataPoint
 
+_SUM_RESYNC_INTERVAL = 1024
+
+
+def _rolling_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Sums of each length-``window`` slice of ``values`` in O(T).
+
+    The cumsum is restarted every ``_SUM_RESYNC_INTERVAL`` windows so its rounding error stays
+    bounded by a block rather than growing with the length of the series.
+    """
+    count = values.size - window + 1
+    sums = np.empty(max(count, 0), dtype=np.float64)
+    for start in range(0, count, _SUM_RESYNC_INTERVAL):
+        stop = min(start + _SUM_RESYNC_INTERVAL, count)
+        cumulative = np.concatenate(([0.0], np.cumsum(values[start : stop + window - 1])))
+        sums[start:stop] = cumulative[window:] - cumulative[: stop - start]
+    return sums
+
+
+def _run_kernel(kernel, symbol_ids, prices: np.ndarray, window: int, threshold: float, *extra):
+    symbol_ids = np.asarray(symbol_ids, dtype=np.int64)
+    side, metric = kernel(symbol_ids, prices, window, float(threshold), int(symbol_ids.max()) + 1, *extra)
+    return side != 0, side, metric
+
+
+class Signal(NamedTuple):
+    """Trading signal published to observers and executed as an order.
+
+    ``metric`` is the strategy-specific trigger value (deviation from the mean, breakout size).
+    """
+
+    symbol: str
+    price: float
+    action: str
+    strategy: str
+    metric: float
+    timestamp: datetime
+    size: int
+
 
 class Strategy(ABC):
     """Abstract trading strategy."""
@@ -13,60 +58,173 @@ class Strategy(ABC):
     def __init__(self, lookback_window: int, threshold: float) -> None:
         self.lookback_window = lookback_window
         self.threshold = threshold
+        self._name = self.__class__.__name__
 
     @abstractmethod
-    def generate_signals(self, tick: "MarketDataPoint") -> List[dict]:
+    def generate_signals(self, tick: "MarketDataPoint") -> List[Signal]:
         raise NotImplementedError
 
+    def generate_signals_batch(
+        self, symbol_ids: np.ndarray, prices: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorised signal detection over structure-of-arrays tick data.
+
+        Returns ``(mask, side, metric)`` aligned with ``prices``: ``mask`` flags firing ticks,
+        ``side`` is ``1`` for BUY and ``-1`` for SELL. The batch starts from an empty history
+        and does not touch the per-tick state used by :meth:`generate_signals`. Optional:
+        strategies without a batch path only need :meth:`generate_signals`.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support batch signals")
+
+    def batch_signals(
+        self, timestamps: np.ndarray, symbol_ids: np.ndarray, prices: np.ndarray, symbols: Sequence[str]
+    ) -> List[Signal]:
+        """Materialise signal payloads for the ticks flagged by :meth:`generate_signals_batch`."""
+        mask, side, metric = self.generate_signals_batch(symbol_ids, prices)
+        fired = np.flatnonzero(mask)
+        fired_timestamps = timestamps[fired]
+        if fired_timestamps.dtype.kind == "M":
+            fired_timestamps = fired_timestamps.astype("datetime64[us]").astype(object)
+        name = self._name
+        # Callers typically derive ``symbols`` via np.unique, which yields fresh strings.
+        symbols = [intern(symbol) for symbol in symbols]
+        return [
+            Signal(symbols[symbol_id], price, "BUY" if action > 0 else "SELL", name, value, timestamp, 100)
+            for timestamp, symbol_id, price, action, value in zip(
+                fired_timestamps,
+                symbol_ids[fired].tolist(),
+                prices[fired].tolist(),
+                side[fired].tolist(),
+                metric[fired].tolist(),
+            )
+        ]
+
+    def generate_signals_bulk(self, ticks: Iterable["MarketDataPoint"]) -> List[Signal]:
+        """Signals a fresh strategy would emit for ``ticks``, computed through the batch path."""
+        ticks = list(ticks)
+        if not ticks:
+            return []
+        timestamps, tickers, prices = zip(*ticks)
+        symbols, symbol_ids = np.unique(np.array(tickers), return_inverse=True)
+        return self.batch_signals(
+            np.array(timestamps, dtype=object), symbol_ids, np.array(prices, dtype=np.float64), symbols.tolist()
+        )
+
+    def _build_signal(self, tick: "MarketDataPoint", action: str, metric: float) -> Signal:
+        return Signal(tick.symbol, tick.price, action, self._name, metric, tick.timestamp, 100)
+
 
 class MeanReversionStrategy(Strategy):
     def __init__(self, lookback_window: int, threshold: float) -> None:
         super().__init__(lookback_window, threshold)
         self._history: Dict[str, Deque[float]] = {}
+        self._sums: Dict[str, float] = {}
+        self._evictions: Dict[str, int] = {}
 
-    def generate_signals(self, tick: "MarketDataPoint") -> List[dict]:
-        history = self._history.setdefault(tick.symbol, deque(maxlen=self.lookback_window))
-        history.append(tick.price)
+    def generate_signals(self, tick: "MarketDataPoint") -> List[Signal]:
+        _, symbol, price = tick
+        history = self._history.get(symbol)
+        if history is None:
+            history = self._history[symbol] = deque(maxlen=self.lookback_window)
+        running_sum = self._sums.get(symbol, 0.0)
+        full = len(history) == self.lookback_window
+        if full:
+            running_sum -= history[0]
+        history.append(price)
+        running_sum += price
+        if full:
+            evictions = self._evictions.get(symbol, 0) + 1
+            self._evictions[symbol] = evictions
+            if evictions % _SUM_RESYNC_INTERVAL == 0:
+                # Re-derive the sum so add/subtract rounding error stays bounded on long runs.
+                running_sum = math.fsum(history)
+        self._sums[symbol] = running_sum
         if len(history) < self.lookback_window:
             return []
-        average_price = sum(history) / len(history)
-        deviation = (tick.price - average_price) / average_price if average_price else 0.0
+        average_price = running_sum / len(history)
+        deviation = (price - average_price) / average_price if average_price else 0.0
         if deviation >= self.threshold:
             return [self._build_signal(tick, "SELL", deviation)]
         if deviation <= -self.threshold:
             return [self._build_signal(tick, "BUY", deviation)]
         return []
 
-    def _build_signal(self, tick: "MarketDataPoint", action: str, deviation: float) -> dict:
-        return {
-            "symbol": tick.symbol,
-            "price": tick.price,
-            "action": action,
-            "strategy": self.__class__.__name__,
-            "deviation": deviation,
-            "timestamp": tick.timestamp,
-            "size": 100,
-        }
+    def generate_signals_batch(
+        self, symbol_ids: np.ndarray, prices: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        prices = np.asarray(prices, dtype=np.float64)
+        kernels = optional_module("patterns.strategy_numba")
+        if kernels is not None and prices.size:
+            return _run_kernel(
+                kernels.mean_reversion_signals,
+                symbol_ids,
+                prices,
+                self.lookback_window,
+                self.threshold,
+                _SUM_RESYNC_INTERVAL,
+            )
+        size = prices.size
+        mask = np.zeros(size, dtype=bool)
+        side = np.zeros(size, dtype=np.int8)
+        metric = np.zeros(size, dtype=np.float64)
+        window = self.lookback_window
+        for symbol_id in np.unique(symbol_ids):
+            indices = np.flatnonzero(symbol_ids == symbol_id)
+            if indices.size < window:
+                continue
+            group = prices[indices]
+            averages = _rolling_sums(group, window) / window
+            current = group[window - 1 :]
+            deviation = np.divide(
+                current - averages, averages, out=np.zeros_like(averages), where=averages != 0
+            )
+            sell = deviation >= self.threshold
+            buy = ~sell & (deviation <= -self.threshold)
+            target = indices[window - 1 :]
+            mask[target] = sell | buy
+            side[target] = np.where(sell, -1, np.where(buy, 1, 0))
+            metric[target] = deviation
+        return mask, side, metric
 
 
 class BreakoutStrategy(Strategy):
     def __init__(self, lookback_window: int, threshold: float) -> None:
         super().__init__(lookback_window, threshold)
-        self._history: Dict[str, Deque[float]] = {}
+        self._tick_counts: Dict[str, int] = {}
+        # Monotonic deques of (tick index, price) over the previous lookback_window - 1 ticks;
+        # the front of each holds the rolling max/min.
+        self._max_windows: Dict[str, Deque[Tuple[int, float]]] = {}
+        self._min_windows: Dict[str, Deque[Tuple[int, float]]] = {}
 
-    def generate_signals(self, tick: "MarketDataPoint") -> List[dict]:
-        history = self._history.setdefault(tick.symbol, deque(maxlen=self.lookback_window))
-        history.append(tick.price)
-        if len(history) < self.lookback_window:
-            return []
+    def generate_signals(self, tick: "MarketDataPoint") -> List[Signal]:
+        _, symbol, current_price = tick
+        index = self._tick_counts.get(symbol, 0)
+        self._tick_counts[symbol] = index + 1
+        max_window = self._max_windows.get(symbol)
+        if max_window is None:
+            max_window = self._max_windows[symbol] = deque()
+            min_window = self._min_windows[symbol] = deque()
+        else:
+            min_window = self._min_windows[symbol]
+
+        oldest_index = index - (self.lookback_window - 1)
+        while max_window and max_window[0][0] < oldest_index:
+            max_window.popleft()
+        while min_window and min_window[0][0] < oldest_index:
+            min_window.popleft()
+        ready = index + 1 >= self.lookback_window and bool(max_window)
+        max_price = max_window[0][1] if ready else 0.0
+        min_price = min_window[0][1] if ready else 0.0
 
-        past_prices = list(history)[:-1]
-        current_price = tick.price
-        if not past_prices:
+        while max_window and max_window[-1][1] <= current_price:
+            max_window.pop()
+        max_window.append((index, current_price))
+        while min_window and min_window[-1][1] >= current_price:
+            min_window.pop()
+        min_window.append((index, current_price))
+        if not ready:
             return []
 
-        max_price = max(past_prices)
-        min_price = min(past_prices)
         breakout_up = (current_price - max_price) / max_price if max_price else 0.0
         breakout_down = (current_price - min_price) / min_price if min_price else 0.0
 
@@ -76,13 +234,40 @@ class BreakoutStrategy(Strategy):
             return [self._build_signal(tick, "SELL", breakout_down)]
         return []
 
-    def _build_signal(self, tick: "MarketDataPoint", action: str, breakout: float) -> dict:
-        return {
-            "symbol": tick.symbol,
-            "price": tick.price,
-            "action": action,
-            "strategy": self.__class__.__name__,
-            "breakout": breakout,
-            "timestamp": tick.timestamp,
-            "size": 100,
-        }
+    def generate_signals_batch(
+        self, symbol_ids: np.ndarray, prices: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        prices = np.asarray(prices, dtype=np.float64)
+        kernels = optional_module("patterns.strategy_numba")
+        if kernels is not None and prices.size:
+            return _run_kernel(kernels.breakout_signals, symbol_ids, prices, self.lookback_window, self.threshold)
+        size = prices.size
+        mask = np.zeros(size, dtype=bool)
+        side = np.zeros(size, dtype=np.int8)
+        metric = np.zeros(size, dtype=np.float64)
+        window = self.lookback_window
+        if window < 2:
+            return mask, side, metric
+        for symbol_id in np.unique(symbol_ids):
+            indices = np.flatnonzero(symbol_ids == symbol_id)
+            if indices.size < window:
+                continue
+            group = prices[indices]
+            # Each current tick is compared with the lookback_window - 1 ticks before it.
+            past = sliding_window_view(group, window - 1)[:-1]
+            max_prices = past.max(axis=1)
+            min_prices = past.min(axis=1)
+            current = group[window - 1 :]
+            breakout_up = np.divide(
+                current - max_prices, max_prices, out=np.zeros_like(max_prices), where=max_prices != 0
+            )
+            breakout_down = np.divide(
+                current - min_prices, min_prices, out=np.zeros_like(min_prices), where=min_prices != 0
+            )
+            buy = breakout_up >= self.threshold
+            sell = ~buy & (breakout_down <= -self.threshold)
+            target = indices[window - 1 :]
+            mask[target] = buy | sell
+            side[target] = np.where(buy, 1, np.where(sell, -1, 0))
+            metric[target] = np.where(buy, breakout_up, breakout_down)
+        return mask, side, metric
@@ -0,0 +1,96 @@
+"""Numba-compiled batch signal kernels backing :mod:`patterns.strategy`.
+
+Importing this module raises ``ImportError`` when numba is not installed;
+the strategies then fall back to their NumPy batch implementation.
+
+Each kernel walks the ticks once in order, keeping a per-symbol ring buffer of the
+lookback window, and returns ``(side, metric)`` arrays aligned with ``prices``:
+``side`` is ``1`` for BUY, ``-1`` for SELL and ``0`` where no signal fires.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def mean_reversion_signals(symbol_ids, prices, window, threshold, symbol_count, resync_interval):
+    size = prices.shape[0]
+    side = np.zeros(size, dtype=np.int8)
+    metric = np.zeros(size, dtype=np.float64)
+    buffers = np.zeros((symbol_count, window), dtype=np.float64)
+    counts = np.zeros(symbol_count, dtype=np.int64)
+    sums = np.zeros(symbol_count, dtype=np.float64)
+    for i in range(size):
+        symbol = symbol_ids[i]
+        price = prices[i]
+        count = counts[symbol]
+        slot = count % window
+        if count >= window:
+            sums[symbol] -= buffers[symbol, slot]
+        buffers[symbol, slot] = price
+        sums[symbol] += price
+        count += 1
+        counts[symbol] = count
+        if count < window:
+            continue
+        evictions = count - window
+        if evictions > 0 and evictions % resync_interval == 0:
+            # Same cadence as the streaming path; numba has no math.fsum, so re-derive the
+            # sum with Neumaier compensation instead.
+            total = 0.0
+            compensation = 0.0
+            for k in range(window):
+                value = buffers[symbol, k]
+                t = total + value
+                if abs(total) >= abs(value):
+                    compensation += (total - t) + value
+                else:
+                    compensation += (value - t) + total
+                total = t
+            sums[symbol] = total + compensation
+        average = sums[symbol] / window
+        deviation = (price - average) / average if average != 0 else 0.0
+        if deviation >= threshold:
+            side[i] = -1
+            metric[i] = deviation
+        elif deviation <= -threshold:
+            side[i] = 1
+            metric[i] = deviation
+    return side, metric
+
+
+@njit(cache=True, nogil=True)
+def breakout_signals(symbol_ids, prices, window, threshold, symbol_count):
+    size = prices.shape[0]
+    side = np.zeros(size, dtype=np.int8)
+    metric = np.zeros(size, dtype=np.float64)
+    past = window - 1
+    if past < 1:
+        return side, metric
+    buffers = np.zeros((symbol_count, past), dtype=np.float64)
+    counts = np.zeros(symbol_count, dtype=np.int64)
+    for i in range(size):
+        symbol = symbol_ids[i]
+        price = prices[i]
+        count = counts[symbol]
+        if count >= past:
+            max_price = buffers[symbol, 0]
+            min_price = max_price
+            for k in range(1, past):
+                value = buffers[symbol, k]
+                if value > max_price:
+                    max_price = value
+                elif value < min_price:
+                    min_price = value
+            breakout_up = (price - max_price) / max_price if max_price != 0 else 0.0
+            breakout_down = (price - min_price) / min_price if min_price != 0 else 0.0
+            if breakout_up >= threshold:
+                side[i] = 1
+                metric[i] = breakout_up
+            elif breakout_down <= -threshold:
+                side[i] = -1
+                metric[i] = breakout_down
+        buffers[symbol, count % past] = price
+        counts[symbol] = count + 1
+    return side, metric
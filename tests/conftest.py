@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import pytest
+
+from data_loader import InstrumentCSVLoader, MarketDataLoader, MarketDataPoint
+from models import Instrument
+
+
+@pytest.fixture(scope="session")
+def instruments() -> List[Instrument]:
+    """Instruments parsed once per test process from ``instruments.csv``."""
+    return InstrumentCSVLoader("instruments.csv").load()
+
+
+@pytest.fixture(scope="session")
+def market_ticks() -> Tuple[MarketDataPoint, ...]:
+    """Leading ticks of ``market_data.csv``, shared by the parametrized strategy tests."""
+    return tuple(MarketDataLoader("market_data.csv").iter_ticks(limit=3_000))
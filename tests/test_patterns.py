@@ -1,26 +1,62 @@
 from __future__ import annotations
 
+import math
 from datetime import datetime, timedelta
+from sys import intern
 
-from data_loader import InstrumentCSVLoader, MarketDataPoint
-from models import BetaDecorator, DrawdownDecorator, Stock, VolatilityDecorator
+import numpy as np
+import pytest
+
+from analytics import calculate_max_drawdown
+from data_loader import MarketDataLoader, MarketDataPoint
+from engine import TradingEngine
+from models import BetaDecorator, DrawdownDecorator, MultiMetricsDecorator, Stock, VolatilityDecorator
 from patterns.command import CommandInvoker, ExecuteOrderCommand, OrderBook, UndoOrderCommand
 from patterns.observer import AlertObserver, LoggerObserver, SignalPublisher
-from patterns.singleton import Config
-from patterns.strategy import BreakoutStrategy, MeanReversionStrategy
+from patterns.singleton import Config, get_config
+from patterns.strategy import BreakoutStrategy, MeanReversionStrategy, Signal
+
+_FIXED_TS = datetime(2024, 1, 1)
+
+
+def test_factory_creates_instrument_types(instruments):
+    names = {type(inst).__name__ for inst in instruments}
+    assert {"Stock", "Bond", "ETF"}.issubset(names)
+
 
+def test_fast_tick_loader_matches_row_loader():
+    pytest.importorskip("pandas")
+    loader = MarketDataLoader("market_data.csv")
+    expected = list(loader.iter_ticks(symbols=["AAPL", "SPY"], limit=200))
+    assert list(loader.iter_ticks_fast(symbols=["AAPL", "SPY"], limit=200)) == expected
 
-def test_factory_creates_instrument_types():
-    instruments = InstrumentCSVLoader("instruments.csv").load()
-    assert any(inst.__class__.__name__ == "Stock" for inst in instruments)
-    assert any(inst.__class__.__name__ == "Bond" for inst in instruments)
-    assert any(inst.__class__.__name__ == "ETF" for inst in instruments)
+
+def test_mmap_tick_loader_matches_row_loader():
+    loader = MarketDataLoader("market_data.csv")
+    expected = list(loader.iter_ticks(symbols=["MSFT"], limit=200))
+    assert list(loader.iter_ticks_mmap(symbols=["MSFT"], limit=200)) == expected
+
+
+def test_per_symbol_quota_stops_once_present_symbols_fill(tmp_path):
+    path = tmp_path / "ticks.csv"
+    path.write_text(
+        "timestamp,symbol,price\n"
+        "2024-01-01 09:30:00,AAPL,1.0\n"
+        "2024-01-01 09:30:01,AAPL,2.0\n"
+        "2024-01-01 09:30:02,AAPL,3.0\n"
+        "2024-01-01 09:30:03,MSFT,4.0\n"
+        "2024-01-01 09:30:04,MSFT,5.0\n"
+        "truncated\n"  # raises IndexError if the scan does not stop before it
+    )
+    ticks = MarketDataLoader(path).iter_ticks(symbols=["AAPL", "MSFT", "NOPE"], limit_per_symbol=2)
+    assert [(tick.symbol, tick.price) for tick in ticks] == [("AAPL", 1.0), ("AAPL", 2.0), ("MSFT", 4.0), ("MSFT", 5.0)]
 
 
 def test_config_singleton():
     config_a = Config()
     config_b = Config()
     assert config_a is config_b
+    assert get_config() is config_a
     assert "log_level" in config_a.data
 
 
@@ -37,6 +73,28 @@ def test_decorators_add_metrics():
     assert "max_drawdown" in metrics
 
 
+def test_max_drawdown_of_rising_series_is_positive_zero():
+    drawdown = calculate_max_drawdown([1, 2, 3])
+    assert drawdown == 0.0 and math.copysign(1.0, drawdown) == 1.0
+
+
+def test_multi_metrics_decorator_matches_chained_decorators():
+    base_instrument = Stock("TEST", 100.0, "Tech", "Test Inc")
+    price_history = [100, 102, 101, 103, 105, 99, 104]
+    benchmark_history = [200, 199, 201, 202, 204]
+    chained = DrawdownDecorator(
+        BetaDecorator(VolatilityDecorator(base_instrument, price_history), price_history, benchmark_history),
+        price_history,
+    ).get_metrics()
+    fused = MultiMetricsDecorator(base_instrument, price_history, benchmark_history).get_metrics()
+    assert fused.keys() == chained.keys()
+    for key, value in chained.items():
+        assert fused[key] == pytest.approx(value)
+
+    rising = MultiMetricsDecorator(base_instrument, [100, 101, 102], benchmark_history).get_metrics()
+    assert math.copysign(1.0, rising["max_drawdown"]) == 1.0
+
+
 def test_observer_notifications_and_command_lifecycle():
     publisher = SignalPublisher()
     logger = LoggerObserver()
@@ -44,17 +102,19 @@ def test_observer_notifications_and_command_lifecycle():
     publisher.attach(logger)
     publisher.attach(alert)
 
-    signal = {
-        "symbol": "AAPL",
-        "price": 200.0,
-        "action": "BUY",
-        "size": 10,
-        "strategy": "TestStrategy",
-        "timestamp": datetime.utcnow(),
-    }
+    signal = Signal(
+        symbol="AAPL",
+        price=200.0,
+        action="BUY",
+        strategy="TestStrategy",
+        metric=0.0,
+        timestamp=_FIXED_TS,
+        size=10,
+    )
     publisher.notify(signal)
     assert logger.records[-1] == signal
     assert alert.alerts and alert.alerts[-1]["notional"] == 2000.0
+    assert signal in alert
 
     order_book = OrderBook()
     invoker = CommandInvoker()
@@ -65,31 +125,146 @@ def test_observer_notifications_and_command_lifecycle():
     undo_command = UndoOrderCommand(order_book, signal)
     invoker.execute(undo_command)
     assert signal not in order_book.executed_orders
+    assert signal not in order_book
 
     invoker.undo()
     assert signal in order_book.executed_orders
+    assert signal in order_book
 
     invoker.undo()
     assert signal not in order_book.executed_orders
+    assert signal not in order_book
 
     invoker.redo()
     assert signal in order_book.executed_orders
+    assert signal in order_book
 
 
-def test_strategy_outputs_expected_signals():
-    timestamps = [datetime.utcnow() + timedelta(seconds=i) for i in range(5)]
-    mean_reversion = MeanReversionStrategy(lookback_window=3, threshold=0.05)
-    prices = [100, 100, 100, 120]
+def test_bounded_invoker_history_drops_oldest_commands():
+    order_book = OrderBook()
+    invoker = CommandInvoker(max_history=2)
+    orders = [Signal(f"SYM{i}", 10.0, "BUY", "TestStrategy", 0.0, _FIXED_TS, 1) for i in range(3)]
+    for order in orders:
+        invoker.execute(ExecuteOrderCommand(order_book, order))
+
+    assert invoker.undo() is not None
+    assert invoker.undo() is not None
+    assert invoker.undo() is None
+    assert order_book.executed_orders == orders[:1]
+
+    invoker.redo()
+    invoker.redo()
+    assert order_book.executed_orders == orders
+
+
+def test_notify_batch_matches_individual_notifications():
+    signals = [
+        Signal("AAPL", 200.0, "BUY", "TestStrategy", 0.0, _FIXED_TS, 10),
+        Signal("MSFT", 50.0, "SELL", "TestStrategy", 0.0, _FIXED_TS, 10),
+    ]
+    single, batched = SignalPublisher(), SignalPublisher()
+    single_alert, batched_alert = AlertObserver(threshold_notional=1_000), AlertObserver(threshold_notional=1_000)
+    batched_logger = LoggerObserver()
+    single.attach(single_alert)
+    batched.attach(batched_alert)
+    batched.attach(batched_logger)
+
+    for signal in signals:
+        single.notify(signal)
+    batched.notify_batch(signals)
+
+    assert batched_logger.records == signals
+    assert batched_alert.alerts == single_alert.alerts
+    assert [alert["notional"] for alert in batched_alert.alerts] == [2000.0]
+    assert signals[0] in batched_alert and signals[1] not in batched_alert
+
+
+@pytest.mark.parametrize(
+    "strategy_cls, prices, expected_action",
+    [
+        (MeanReversionStrategy, [100, 100, 100, 120], "SELL"),
+        (BreakoutStrategy, [100, 101, 102, 110], "BUY"),
+    ],
+)
+def test_strategy_outputs_expected_signals(strategy_cls, prices, expected_action):
+    timestamps = [_FIXED_TS + timedelta(seconds=i) for i in range(5)]
+    strategy = strategy_cls(lookback_window=3, threshold=0.05)
     signals = []
     for ts, price in zip(timestamps, prices):
         tick = MarketDataPoint(timestamp=ts, symbol="TEST", price=price)
-        signals.extend(mean_reversion.generate_signals(tick))
-    assert signals and signals[-1]["action"] == "SELL"
+        signals.extend(strategy.generate_signals(tick))
+    assert signals and signals[-1].action == expected_action
 
-    breakout = BreakoutStrategy(lookback_window=3, threshold=0.05)
-    signals = []
-    breakout_prices = [100, 101, 102, 110]
-    for ts, price in zip(timestamps, breakout_prices):
-        tick = MarketDataPoint(timestamp=ts, symbol="TEST", price=price)
-        signals.extend(breakout.generate_signals(tick))
-    assert signals and signals[-1]["action"] == "BUY"
+
+def _reference_signals(strategy_cls, ticks, window, threshold):
+    """(symbol, action, timestamp, price) of each signal, recomputing every window from scratch."""
+    histories, signals = {}, []
+    for tick in ticks:
+        history = histories.setdefault(tick.symbol, [])
+        history.append(tick.price)
+        if len(history) < window:
+            continue
+        recent = history[-window:]
+        if strategy_cls is MeanReversionStrategy:
+            average = sum(recent) / window
+            deviation = (tick.price - average) / average
+            action = "SELL" if deviation >= threshold else "BUY" if deviation <= -threshold else None
+        else:
+            high, low = max(recent[:-1]), min(recent[:-1])
+            if (tick.price - high) / high >= threshold:
+                action = "BUY"
+            elif (tick.price - low) / low <= -threshold:
+                action = "SELL"
+            else:
+                action = None
+        if action is not None:
+            signals.append((tick.symbol, action, tick.timestamp, tick.price))
+    return signals
+
+
+@pytest.mark.parametrize("use_numba", [True, False], ids=["kernel", "numpy"])
+@pytest.mark.parametrize("strategy_cls", [MeanReversionStrategy, BreakoutStrategy])
+def test_batch_signals_match_per_tick_signals(strategy_cls, use_numba, market_ticks, monkeypatch):
+    if not use_numba:
+        monkeypatch.setattr("patterns.strategy.optional_module", lambda name: None)
+    ticks = market_ticks
+    symbols, symbol_ids = np.unique([tick.symbol for tick in ticks], return_inverse=True)
+    timestamps = np.array([tick.timestamp for tick in ticks], dtype="datetime64[us]")
+    prices = np.array([tick.price for tick in ticks])
+
+    streaming = strategy_cls(lookback_window=10, threshold=0.001)
+    expected = [signal for tick in ticks for signal in streaming.generate_signals(tick)]
+    batched = strategy_cls(lookback_window=10, threshold=0.001).batch_signals(
+        timestamps, symbol_ids, prices, symbols.tolist()
+    )
+    bulk = strategy_cls(lookback_window=10, threshold=0.001).generate_signals_bulk(ticks)
+    assert expected
+    summary = [(s.symbol, s.action, s.timestamp, s.price) for s in expected]
+    assert summary == _reference_signals(strategy_cls, ticks, window=10, threshold=0.001)
+    assert [(s.symbol, s.action, s.timestamp, s.price) for s in batched] == summary
+    assert [(s.symbol, s.action, s.timestamp, s.price) for s in bulk] == summary
+    assert all(s.symbol is intern(s.symbol) for s in batched + bulk)
+
+
+def test_run_batch_matches_streaming_run(market_ticks):
+    def build_engine():
+        publisher = SignalPublisher()
+        logger = LoggerObserver()
+        publisher.attach(logger)
+        return TradingEngine(MeanReversionStrategy(lookback_window=10, threshold=0.001), publisher), logger
+
+    streaming, streaming_logger = build_engine()
+    streaming.run(market_ticks)
+
+    symbols, symbol_ids = np.unique([tick.symbol for tick in market_ticks], return_inverse=True)
+    batched, batched_logger = build_engine()
+    batched.run_batch(
+        np.array([tick.timestamp for tick in market_ticks], dtype="datetime64[us]"),
+        symbol_ids,
+        np.array([tick.price for tick in market_ticks]),
+        symbols.tolist(),
+    )
+
+    assert streaming.order_book.executed_orders
+    assert batched.order_book.executed_orders == streaming.order_book.executed_orders
+    assert batched_logger.records == streaming_logger.records